@@ -2,30 +2,186 @@
 from __future__ import annotations
 
 import argparse
+import base64
 import datetime as dt
+import functools
+import hashlib
 import html
+import http.client
 import json
+import logging
+import os
 import re
 import ssl
 import sys
-from dataclasses import dataclass, field
+import threading
+import time
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional, Tuple
-from urllib.parse import urljoin
-from urllib.request import Request, urlopen
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+from urllib.error import HTTPError
+from urllib.parse import unquote, urljoin, urlsplit
+from urllib.request import getproxies, proxy_bypass
+
+try:
+    import orjson
+except ImportError:  # optional speedup; the stdlib json module is used otherwise
+    orjson = None
+
+log = logging.getLogger("generate-summary")
 
 JST = dt.timezone(dt.timedelta(hours=9))
 WEEKDAYS_JA = "月火水木金土日"
 UA = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/145.0 Safari/537.36"
-
-
-@dataclass
+# Each source lives on its own host, so sites are scraped concurrently (I/O bound).
+SITE_WORKERS = 16
+# Detail pages of one site share a host; keep per-site fan-out modest.
+DETAIL_WORKERS = 8
+# Hard cap on in-flight requests per host, whichever sites or threads issue them.
+MAX_REQUESTS_PER_HOST = 8
+# Same limit as urllib's redirect handler.
+MAX_REDIRECTS = 10
+REDIRECT_STATUSES = {301, 302, 303, 307, 308}
+# Transient server errors are retried with exponential backoff (0.5s, 1s, 2s),
+# or after the server's Retry-After (capped) when it sends one.
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+MAX_RETRIES = 3
+RETRY_BACKOFF = 0.5
+RETRY_AFTER_MAX = 10.0
+
+# Patterns are compiled once at import; the scrapers run them per card/row.
+_RE_WS = re.compile(r"[\t\r\n ]+")
+# <br> and </p><p> both become line breaks, so strip_tags handles them in one pass.
+_RE_LINE_BREAK_TAG = re.compile(r"<br\s*/?>|</p>\s*<p[^>]*>", re.I)
+_RE_TAG = re.compile(r"<[^>]+>")
+_RE_HHMM = re.compile(r"(\d{1,2}:\d{2})")
+_RE_HHMM_PARTS = re.compile(r"(\d{1,2}):(\d{2})")
+_RE_END_ESTIMATED = re.compile(r"終演.*予定|予定.*終演")
+_RE_JP_DATE = re.compile(r"(\d{4})年\s*(\d{1,2})月\s*(\d{1,2})日")
+_RE_ISO_DATE = re.compile(r"\d{4}-\d{2}-\d{2}")
+_RE_P = re.compile(r"<p[^>]*>(.*?)</p>", re.S | re.I)
+_RE_IMG_SRC = re.compile(r"<img[^>]+src=[\"']([^\"']+)[\"']", re.S | re.I)
+_RE_A_HREF = re.compile(r"<a[^>]+href=[\"']([^\"']+)[\"'][^>]*>(.*?)</a>", re.S | re.I)
+_RE_A_HREF_DQ = re.compile(r"<a[^>]+href=\"([^\"]+)\"[^>]*>(.*?)</a>", re.S | re.I)
+
+_RE_KITARA_H2 = re.compile(r"<h2>(.*?)</h2>", re.S | re.I)
+_RE_KITARA_PLACE = re.compile(r"<b[^>]*class=[\"'][^\"']*place[^\"']*[\"'][^>]*>(.*?)</b>", re.S | re.I)
+_RE_KITARA_CARD = re.compile(r"<article class=\"card\">(.*?)</article>", re.S | re.I)
+# Field patterns below match only the opening token and capture the content in a
+# lookahead, so one finditer pass over a card still sees fields nested in others.
+_RE_KITARA_CARD_FIELDS = re.compile(
+    r"<span class=\"date\">(?=(?P<date>.*?)</span>)"
+    r"|<h4 class=\"title\">(?=(?P<title>.*?)</h4>)"
+    r"|href=\"(?P<href>[^\"]*event_detail\.php\?num=\d+)\""
+    r"|<div class=\"thumb\">(?=.*?<img[^>]+src=\"(?P<thumb>[^\"]+)\")"
+    r"|<b class=\"place[^\"]*\">(?=(?P<place>.*?)</b>)",
+    re.S | re.I,
+)
+
+_RE_PLAZA_TITLE = re.compile(r"<h3 class=\"title\">(.*?)</h3>", re.S | re.I)
+_RE_PLAZA_IMAGE = re.compile(r"<img[^>]+src=\"([^\"]+)\"[^>]*class=\"[^\"]*w top[^\"]*\"[^>]*>\s*<p>(.*?)</p>", re.S | re.I)
+_RE_PLAZA_ITEM = re.compile(r"<p class=\"date\">(.*?)</p>.*?<h4 class=\"txt_b\"><a href=\"([^\"]+)\">(.*?)</a>", re.S | re.I)
+
+_RE_SHIMIN_ROW = re.compile(r"<tr id=\"(event[^\"]+)\">(.*?)</tr>", re.S | re.I)
+_RE_SHIMIN_ROW_START = re.compile(r"<tr id=\"event", re.I)
+_RE_SHIMIN_DAY = re.compile(r"<p class=\"day\">(\d+)</p>")
+_RE_SHIMIN_TITLE = re.compile(r"<td class=\"tbody01\">(.*?)</td>", re.S | re.I)
+_RE_SHIMIN_OPEN = re.compile(r"data-label=\"開場\"[^>]*>\s*(.*?)</td>", re.S | re.I)
+_RE_SHIMIN_START = re.compile(r"data-label=\"開演\"[^>]*>\s*(.*?)</td>", re.S | re.I)
+_RE_SHIMIN_FLYER = re.compile(r"<p class=\"flyer\"><a href=\"([^\"]+)\"[^>]*>(.*?)</a>", re.S | re.I)
+
+_RE_MUSICFUN_MAIN_IMG = re.compile(r'<div[^>]*class="main"[^>]*>.*?<img[^>]+src="([^"]+)"', re.S | re.I)
+_RE_MUSICFUN_ITEM = re.compile(
+    r"<li>\s*<a href=\"([^\"]+)\">\s*"
+    r"<img[^>]+src=\"([^\"]+)\"[^>]*>\s*<div>\s*"
+    r"<h5>(.*?)</h5>\s*"
+    r"<p class=\"date\">(.*?)</p>\s*"
+    r"<p class=\"lead\">(.*?)</p>",
+    re.S | re.I,
+)
+
+_RE_MA_DATE = re.compile(r"<p id=\"op_st_date\">\s*(.*?)\s*</p>", re.S | re.I)
+_RE_MA_TIME = re.compile(r"id='op_st_time'[^>]*>\s*OPEN\s*/\s*(\d{1,2}:\d{2}).*?START\s*/\s*(\d{1,2}:\d{2})", re.S | re.I)
+_RE_MA_HALL = re.compile(r"<p id='hall_name'[^>]*>(.*?)</p>", re.S | re.I)
+_RE_MA_IMG = re.compile(r"<div class=\"swiper-slide\"><img src=\"([^\"]+)\"", re.I)
+_RE_MA_TITLE_BLOCK = re.compile(r"<div class=['\"]title['\"]>(.*?)</div>", re.S | re.I)
+_RE_MA_DTSTART = re.compile(r"class=['\"]value-title['\"][^>]*title=['\"](\d{4}-\d{2}-\d{2})T(\d{2}:\d{2})", re.I)
+_RE_MA_HREF = re.compile(r"<a[^>]+href=['\"]([^'\"]*more\.php\?no=\d+)[^'\"]*['\"]", re.I)
+_RE_MA_SUMMARY = re.compile(r"<span class=['\"]summary['\"]>(.*?)</span>", re.S | re.I)
+_RE_MA_TITLE_ATTR = re.compile(r"<a[^>]+title=['\"](.*?)['\"]", re.S | re.I)
+_RE_MA_HALL_ATTR = re.compile(r"class=['\"][^'\"]*\bhall\b[^'\"]*['\"][^>]*title=['\"](.*?)['\"]", re.S | re.I)
+_RE_MA_RSS_ITEM = re.compile(r"<item>(.*?)</item>", re.S | re.I)
+_RE_MA_RSS_TITLE = re.compile(r"<title>(.*?)</title>", re.S | re.I)
+_RE_MA_RSS_LINK = re.compile(r"<link>(.*?)</link>", re.S | re.I)
+_RE_MA_RSS_DESC = re.compile(r"<description>(.*?)</description>", re.S | re.I)
+_RE_MA_RSS_DATE = re.compile(r"公演日：(\d{4})年(\d{1,2})月(\d{1,2})日")
+_RE_MA_RSS_VENUE = re.compile(r"会場：(.+)")
+_RE_MA_RSS_IMG = re.compile(r"<img src='([^']+)'", re.I)
+
+_RE_KYOBUN_ITEM = re.compile(r"<dt class=\"date\">(.*?)</dt>\s*<dd class=\"event_link\">(.*?)</dd>", re.S | re.I)
+_RE_KYOBUN_FIELDS = re.compile(
+    r"<p class=\"title\">(?=(?P<title>.*?)</p>)(?:(?=.*?<a href=\"(?P<href>[^\"]+)\">(?P<link_title>.*?)</a>))?"
+    r"|<p class=\"time\">(?=(?P<time>.*?)</p>)"
+    r"|<div class=\"event_photo\">(?=.*?<img[^>]+src=\"(?P<img>[^\"]+)\")"
+    r"|<p class=\"icon [^\"]+\">(?=(?P<hall>.*?)</p>)",
+    re.S | re.I,
+)
+
+_RE_DOME_BLOCK = re.compile(
+    r"<li class=\"un_eventlist_item[^\"]*\"[^>]*data-event-day=\"(\d{8})\"[^>]*>(.*?)</li>\s*(?=<li class=\"un_eventlist_item|</ul>)",
+    re.S | re.I,
+)
+_RE_DOME_TITLE_MAIN = re.compile(r"un_eventlist_detailTtl__main\">(.*?)</span>", re.S | re.I)
+_RE_DOME_TITLE_SUB = re.compile(r"un_eventlist_detailTtl__sub\">(.*?)</span>", re.S | re.I)
+_RE_DOME_LINK = re.compile(r"<a(?=[^>]*class=\"js_eventItemLink\")[^>]*href=\"([^\"]+)\"", re.I)
+# Group 1 is the lazy-load data-src when the <img> has one, group 2 its plain src.
+_RE_DOME_IMG = re.compile(
+    r"<div class=\"un_eventlist_img.*?<img(?=[^>]*?data-src=\"([^\"]+)\")?[^>]+src=\"([^\"]+)\"",
+    re.S | re.I,
+)
+_RE_DOME_TIME_ROW = re.compile(r"<dt class=\"un_eventlist_opentimeTtl\">(.*?)</dt>\s*<dd class=\"un_eventlist_opentimeTxt\">(.*?)</dd>", re.S | re.I)
+
+_RE_SORA_BLOCK = re.compile(r"<li><time>.*?</li>", re.S | re.I)
+_RE_SORA_TIME = re.compile(r"<time>(.*?)</time>", re.S | re.I)
+_RE_SORA_TITLE = re.compile(r"<dt>催事名</dt><dd>(.*?)</dd>", re.S | re.I)
+_RE_SORA_ORG = re.compile(r"<dt>主催者名</dt><dd>(.*?)</dd>", re.S | re.I)
+
+_RE_ZEPP_BLOCK_START = re.compile(
+    r"<a class=\"sch-content[^\"]*\" href=\"https://www\.zepp\.co\.jp/hall/sapporo/schedule/single/\?rid=\d+\">", re.I
+)
+# Same lookahead-capture layout as _RE_KITARA_CARD_FIELDS: one pass per anchor block.
+_RE_ZEPP_FIELDS = re.compile(
+    r"sch-content-date__year\">(?P<year>\d{4})</p>"
+    r"|sch-content-date__month\">(?P<month>\d{1,2})\.(?P<day>\d{1,2})</p>"
+    r"|<a class=\"sch-content[^\"]*\" href=\"(?P<href>[^\"]+)\""
+    r"|<div class=\"sch-content-img\">(?=.*?<img src=\"(?P<img>[^\"]+)\")"
+    r"|sch-content-text__performer\">(?=(?P<performer>.*?)</h2>)"
+    r"|sch-content-text__ttl\">(?=(?P<title>.*?)</h3>)",
+    re.S | re.I,
+)
+_RE_ZEPP_TIME_ROW = re.compile(
+    r"sch-content-text-date\">.*?sch-content-text-date__open\">(\d{1,2}:\d{2})</span>.*?sch-content-text-date__start\">(\d{1,2}:\d{2})</span>",
+    re.S | re.I,
+)
+
+_RE_TEMPLATE_PLACEHOLDER = re.compile(
+    r"(?P<created>作成日\s*:\s*YYYY-MM-DD)|(?P<site_block><!-- SITE BLOCK START -->.*?<!-- SITE BLOCK END -->)", re.S
+)
+
+
+# Slotted records are smaller and faster to read; dataclass(slots=...) needs Python 3.10+.
+_DATACLASS_SLOTS: Dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class LinkItem:
     label: str
     url: str
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class EventItem:
     site: str
     title: str
@@ -43,7 +199,7 @@ class EventItem:
     links: List[LinkItem] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class SiteResult:
     key: str
     label: str
@@ -52,43 +208,272 @@ class SiteResult:
     note: str = ""
 
 
-def fetch_text(url: str, timeout: int = 20) -> str:
-    req = Request(url, headers={"User-Agent": UA})
+@dataclass(**_DATACLASS_SLOTS)
+class EscapedEvent:
+    # HTML-escaped copies of the EventItem fields that both the card body and
+    # its Google Calendar button print; built once per card.
+    title: str
+    date_iso: str
+    venue: str
+    start_time: str
+    end_time: str
+    url: str
+
+
+# Idle keep-alive connections keyed by (scheme, host, verify). Detail pages are
+# fetched from the same host many times, so reusing sockets saves a TCP+TLS
+# handshake per request compared to one-shot urlopen calls.
+_CONN_POOL: Dict[Tuple[str, str, bool], List[http.client.HTTPConnection]] = {}
+_CONN_POOL_LOCK = threading.Lock()
+_HOST_SLOTS: Dict[str, threading.BoundedSemaphore] = {}
+
+
+@functools.lru_cache(maxsize=None)
+def _proxy_for(scheme: str, netloc: str) -> Optional[Tuple[str, Dict[str, str]]]:
+    # (proxy host:port, proxy headers) when urlopen would route this host through a
+    # proxy (HTTP(S)_PROXY / NO_PROXY, or the system settings on macOS), else None.
+    proxy = getproxies().get(scheme)
+    if not proxy or proxy_bypass(netloc):
+        return None
+    parts = urlsplit(proxy if "://" in proxy else f"http://{proxy}")
+    headers: Dict[str, str] = {}
+    if parts.username is not None:
+        cred = f"{unquote(parts.username)}:{unquote(parts.password or '')}"
+        headers["Proxy-Authorization"] = "Basic " + base64.b64encode(cred.encode("utf-8")).decode("ascii")
+    return parts.netloc.rpartition("@")[2], headers
+
+
+def _new_conn(scheme: str, netloc: str, timeout: float, context: Optional[ssl.SSLContext]) -> http.client.HTTPConnection:
+    proxy = _proxy_for(scheme, netloc)
+    host = proxy[0] if proxy else netloc
+    if scheme == "https":
+        conn = http.client.HTTPSConnection(host, timeout=timeout, context=context)
+        if proxy:
+            conn.set_tunnel(netloc, headers=proxy[1])
+        return conn
+    return http.client.HTTPConnection(host, timeout=timeout)
+
+
+def _acquire_conn(scheme: str, netloc: str, timeout: float, context: Optional[ssl.SSLContext]) -> Tuple[http.client.HTTPConnection, bool]:
+    with _CONN_POOL_LOCK:
+        idle = _CONN_POOL.get((scheme, netloc, context is None))
+        conn = idle.pop() if idle else None
+    if conn is None:
+        return _new_conn(scheme, netloc, timeout, context), False
+    conn.timeout = timeout
+    if conn.sock is not None:
+        conn.sock.settimeout(timeout)
+    return conn, True
+
+
+def _release_conn(scheme: str, netloc: str, context: Optional[ssl.SSLContext], conn: http.client.HTTPConnection) -> None:
+    with _CONN_POOL_LOCK:
+        _CONN_POOL.setdefault((scheme, netloc, context is None), []).append(conn)
+
+
+def _host_slot(netloc: str) -> threading.BoundedSemaphore:
+    with _CONN_POOL_LOCK:
+        slot = _HOST_SLOTS.get(netloc)
+        if slot is None:
+            slot = _HOST_SLOTS[netloc] = threading.BoundedSemaphore(MAX_REQUESTS_PER_HOST)
+        return slot
+
+
+def close_connections() -> None:
+    with _CONN_POOL_LOCK:
+        for conns in _CONN_POOL.values():
+            for conn in conns:
+                conn.close()
+        _CONN_POOL.clear()
+
+
+def _request_once(url: str, timeout: float, context: Optional[ssl.SSLContext]) -> Tuple[http.client.HTTPResponse, bytes]:
+    parts = urlsplit(url)
+    path = parts.path or "/"
+    if parts.query:
+        path = f"{path}?{parts.query}"
+    headers = {"User-Agent": UA}
+    proxy = _proxy_for(parts.scheme, parts.netloc)
+    if proxy and parts.scheme == "http":
+        # Plain HTTP asks the proxy for the absolute URL; HTTPS tunnels through it instead.
+        path = f"http://{parts.netloc}{path}"
+        headers.update(proxy[1])
+    with _host_slot(parts.netloc):
+        return _request_on_pool(parts.scheme, parts.netloc, path, headers, timeout, context)
+
+
+def _request_on_pool(
+    scheme: str, netloc: str, path: str, headers: Dict[str, str], timeout: float, context: Optional[ssl.SSLContext]
+) -> Tuple[http.client.HTTPResponse, bytes]:
+    conn, reused = _acquire_conn(scheme, netloc, timeout, context)
+    while True:
+        try:
+            conn.request("GET", path, headers=headers)
+            resp = conn.getresponse()
+            body = resp.read()
+            break
+        except (http.client.HTTPException, ConnectionError):
+            conn.close()
+            if not reused:
+                raise
+            # The server dropped an idle keep-alive socket; retry once on a fresh connection.
+            conn, reused = _new_conn(scheme, netloc, timeout, context), False
+        except Exception:
+            conn.close()
+            raise
+    if resp.will_close:
+        conn.close()
+    else:
+        _release_conn(scheme, netloc, context, conn)
+    return resp, body
+
+
+def _retry_delay(resp: http.client.HTTPResponse, attempt: int) -> float:
+    retry_after = (resp.getheader("Retry-After") or "").strip()
+    if retry_after.isdigit():
+        return min(float(retry_after), RETRY_AFTER_MAX)
+    return RETRY_BACKOFF * (2**attempt)
+
+
+def _http_get(url: str, timeout: float, context: Optional[ssl.SSLContext] = None) -> Tuple[bytes, Optional[str]]:
+    redirects = retries = 0
+    while True:
+        resp, body = _request_once(url, timeout, context)
+        location = resp.getheader("Location")
+        if resp.status in REDIRECT_STATUSES and location:
+            if redirects == MAX_REDIRECTS:
+                raise HTTPError(url, resp.status, "too many redirects", resp.headers, None)
+            redirects += 1
+            url = urljoin(url, location)
+            if urlsplit(url).scheme not in ("http", "https"):
+                raise HTTPError(url, resp.status, "redirect to a non-HTTP URL", resp.headers, None)
+            continue
+        if resp.status in RETRY_STATUSES and retries < MAX_RETRIES:
+            time.sleep(_retry_delay(resp, retries))
+            retries += 1
+            continue
+        # Like urlopen, anything but 2xx is an error, including a 3xx that was not followed.
+        if not 200 <= resp.status < 300:
+            raise HTTPError(url, resp.status, resp.reason, resp.headers, None)
+        return body, resp.headers.get_content_charset()
+
+
+def write_bytes_atomic(path: Path, data: bytes) -> None:
+    # Write to a sibling temp file and rename it over the target, so readers (and
+    # later runs after a crash) never see a half-written file.
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        tmp.write_bytes(data)
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+# Optional on-disk cache for repeated runs (--cache-dir). None disables it.
+_FETCH_CACHE_DIR: Optional[Path] = None
+# Entries are keyed by URL only, and several listing URLs do not change with the
+# target date; older entries are refetched so a later run never renders stale pages.
+FETCH_CACHE_MAX_AGE = 60 * 60
+
+
+def set_fetch_cache_dir(path: Optional[Path]) -> None:
+    global _FETCH_CACHE_DIR
+    if path is not None:
+        path.mkdir(parents=True, exist_ok=True)
+    _FETCH_CACHE_DIR = path
+    _fetch.cache_clear()
+
+
+def _fetch_network(url: str, timeout: int) -> Tuple[bytes, Optional[str]]:
     try:
-        with urlopen(req, timeout=timeout) as resp:
-            charset = resp.headers.get_content_charset() or "utf-8"
-            return resp.read().decode(charset, errors="replace")
+        return _http_get(url, timeout)
     except Exception as e:
         msg = str(e)
         if "CERTIFICATE_VERIFY_FAILED" in msg:
             pass
         elif "timed out" in msg.lower():
-            with urlopen(req, timeout=max(timeout * 2, 30)) as resp:
-                charset = resp.headers.get_content_charset() or "utf-8"
-                return resp.read().decode(charset, errors="replace")
+            return _http_get(url, max(timeout * 2, 30))
         else:
             raise
-    with urlopen(req, timeout=timeout, context=ssl._create_unverified_context()) as resp:
-        charset = resp.headers.get_content_charset() or "utf-8"
-        return resp.read().decode(charset, errors="replace")
+    return _http_get(url, timeout, context=ssl._create_unverified_context())
+
+
+# Listing and detail pages are fetched at most once per run; callers get the
+# cached bytes on repeat access.
+@functools.lru_cache(maxsize=256)
+def _fetch(url: str, timeout: int) -> Tuple[bytes, Optional[str]]:
+    cache_dir = _FETCH_CACHE_DIR
+    if cache_dir is None:
+        return _fetch_network(url, timeout)
+    # File layout: "<charset>\n<body>"; the charset line is empty when the server sent none.
+    cache_file = cache_dir / hashlib.sha256(url.encode("utf-8")).hexdigest()
+    if cache_file.exists() and time.time() - cache_file.stat().st_mtime < FETCH_CACHE_MAX_AGE:
+        charset, _, body = cache_file.read_bytes().partition(b"\n")
+        return body, charset.decode("ascii") or None
+    body, charset = _fetch_network(url, timeout)
+    write_bytes_atomic(cache_file, (charset or "").encode("ascii") + b"\n" + body)
+    return body, charset
+
+
+def fetch_text(url: str, timeout: int = 20) -> str:
+    body, charset = _fetch(url, timeout)
+    return body.decode(charset or "utf-8", errors="replace")
 
 
 def fetch_bytes(url: str, timeout: int = 20) -> bytes:
-    req = Request(url, headers={"User-Agent": UA})
-    try:
-        with urlopen(req, timeout=timeout) as resp:
-            return resp.read()
-    except Exception as e:
-        msg = str(e)
-        if "CERTIFICATE_VERIFY_FAILED" in msg:
-            pass
-        elif "timed out" in msg.lower():
-            with urlopen(req, timeout=max(timeout * 2, 30)) as resp:
-                return resp.read()
-        else:
+    return _fetch(url, timeout)[0]
+
+
+def json_loads(data: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dump_result(result: SiteResult) -> str:
+    # One-line JSON of a scraped site (dates as YYYY-MM-DD), for --verbose.
+    if orjson is not None:
+        return orjson.dumps(result).decode("utf-8")
+    return json.dumps(asdict(result), ensure_ascii=False, separators=(",", ":"), default=str)
+
+
+def map_concurrent(fn: Callable[[Any], Any], items: Iterable[Any], return_exceptions: bool = False) -> List[Any]:
+    # Like map(), but runs fn on a thread pool; results keep the input order.
+    # With return_exceptions=True a failing call yields its exception instead of raising.
+    items = list(items)
+
+    def call(item: Any) -> Any:
+        try:
+            return fn(item)
+        except Exception as e:
+            if return_exceptions:
+                return e
             raise
-    with urlopen(req, timeout=timeout, context=ssl._create_unverified_context()) as resp:
-        return resp.read()
+
+    if len(items) <= 1:
+        return [call(item) for item in items]
+    with ThreadPoolExecutor(max_workers=min(DETAIL_WORKERS, len(items))) as executor:
+        return list(executor.map(call, items))
+
+
+def fetch_and_parse(parse_fn: Callable[..., Any], jobs: List[Tuple[Any, ...]], return_exceptions: bool = False) -> List[Any]:
+    # jobs are (url, *args). All pages are fetched concurrently first, then parsed in
+    # order as parse_fn(page, url, *args); with return_exceptions a failed fetch or
+    # parse yields its exception.
+    pages = map_concurrent(lambda job: fetch_text(job[0]), jobs, return_exceptions=return_exceptions)
+    results: List[Any] = []
+    for page, job in zip(pages, jobs):
+        if isinstance(page, Exception):
+            results.append(page)
+            continue
+        try:
+            results.append(parse_fn(page, *job))
+        except Exception as e:
+            if not return_exceptions:
+                raise
+            results.append(e)
+    return results
 
 
 def decode_bytes(data: bytes, encodings: Iterable[str]) -> str:
@@ -101,30 +486,39 @@ def decode_bytes(data: bytes, encodings: Iterable[str]) -> str:
 
 
 def collapse_ws(s: str) -> str:
-    return re.sub(r"[\t\r\n ]+", " ", s).strip()
+    return _RE_WS.sub(" ", s).strip()
 
 
 def strip_tags(s: str) -> str:
     if s is None:
         return ""
-    s = re.sub(r"<br\s*/?>", "\n", s, flags=re.I)
-    s = re.sub(r"</p>\s*<p[^>]*>", "\n", s, flags=re.I)
-    s = re.sub(r"<[^>]+>", "", s)
+    # Many fragments (titles, times, RSS text) carry no markup at all.
+    if "<" in s:
+        s = _RE_LINE_BREAK_TAG.sub("\n", s)
+        s = _RE_TAG.sub("", s)
     s = html.unescape(s)
     # normalize Japanese full-width spaces only lightly; keep line breaks first
     s = s.replace("\xa0", " ")
-    lines = [collapse_ws(line) for line in s.split("\n")]
-    return "\n".join([line for line in lines if line])
+    out: List[str] = []
+    out_append = out.append
+    for line in s.split("\n"):
+        line = collapse_ws(line)
+        if line:
+            out_append(line)
+    return "\n".join(out)
 
 
 def first_line(text: str) -> str:
     return text.split("\n", 1)[0].strip() if text else ""
 
 
+# A run targets one date, so the date helpers below see the same few inputs per event.
+@functools.lru_cache(maxsize=8)
 def jp_date_compact(date_obj: dt.date) -> str:
     return f"{date_obj.year}年{date_obj.month}月{date_obj.day}日"
 
 
+@functools.lru_cache(maxsize=8)
 def jp_date_display(date_obj: dt.date) -> str:
     return f"{date_obj.year}年{date_obj.month}月{date_obj.day}日（{WEEKDAYS_JA[date_obj.weekday()]}）"
 
@@ -133,46 +527,59 @@ def hhmm_or_empty(value: Optional[str]) -> str:
     return value or ""
 
 
+@functools.lru_cache(maxsize=256)
 def normalize_hhmm(value: Optional[str]) -> Optional[str]:
     if not value:
         return None
-    m = re.search(r"(\d{1,2}):(\d{2})", value)
+    m = _RE_HHMM_PARTS.search(value)
     if not m:
         return None
     return f"{int(m.group(1)):02d}:{m.group(2)}"
 
 
+def _is_hhmm(value: Optional[str]) -> bool:
+    return bool(value) and _RE_HHMM.fullmatch(value) is not None
+
+
+@functools.lru_cache(maxsize=32)
+def _label_time_patterns(label: str) -> Tuple[re.Pattern, re.Pattern]:
+    return (
+        re.compile(rf"(\d{{1,2}}:\d{{2}})\s*{label}"),
+        re.compile(rf"{label}[^\d]*(\d{{1,2}}:\d{{2}})"),
+    )
+
+
 def extract_time(text: str, label: str) -> Optional[str]:
-    patterns = [
-        rf"(\d{{1,2}}:\d{{2}})\s*{label}",
-        rf"{label}[^\d]*(\d{{1,2}}:\d{{2}})",
-    ]
-    for pat in patterns:
-        m = re.search(pat, text)
+    for pat in _label_time_patterns(label):
+        m = pat.search(text)
         if m:
             return m.group(1)
     return None
 
 
 def extract_any_hhmm(text: str) -> Optional[str]:
-    m = re.search(r"(\d{1,2}:\d{2})", text or "")
+    m = _RE_HHMM.search(text or "")
     return normalize_hhmm(m.group(1)) if m else None
 
 
 def extract_times(text: str) -> Dict[str, Optional[str]]:
-    t = strip_tags(text)
+    return extract_times_plain(strip_tags(text))
+
+
+def extract_times_plain(t: str) -> Dict[str, Optional[str]]:
+    # Same as extract_times, for text that has already been through strip_tags.
     return {
         "open": normalize_hhmm(extract_time(t, "開場")),
         "start": normalize_hhmm(extract_time(t, "開演")),
         "end": normalize_hhmm(extract_time(t, "終演")),
-        "end_estimated": bool(re.search(r"終演.*予定|予定.*終演", t)),
+        "end_estimated": bool(_RE_END_ESTIMATED.search(t)),
     }
 
 
 def parse_jp_date_from_text(text: str) -> Optional[dt.date]:
     if not text:
         return None
-    m = re.search(r"(\d{4})年\s*(\d{1,2})月\s*(\d{1,2})日", text)
+    m = _RE_JP_DATE.search(text)
     if not m:
         return None
     try:
@@ -181,22 +588,38 @@ def parse_jp_date_from_text(text: str) -> Optional[dt.date]:
         return None
 
 
+@functools.lru_cache(maxsize=8)
+def _target_date_pattern(date_obj: dt.date) -> re.Pattern:
+    return re.compile(rf"{date_obj.year}年\s*{date_obj.month}月\s*{date_obj.day}日")
+
+
+@functools.lru_cache(maxsize=8)
+def _target_date_line_pattern(date_obj: dt.date) -> re.Pattern:
+    # Same as _target_date_pattern, but a match never spans a line break.
+    return re.compile(rf"{date_obj.year}年[^\S\n]*{date_obj.month}月[^\S\n]*{date_obj.day}日")
+
+
 def match_target_date_text(text: str, date_obj: dt.date) -> bool:
-    return bool(
-        re.search(
-            rf"{date_obj.year}年\s*{date_obj.month}月\s*{date_obj.day}日",
-            text or "",
-        )
-    )
+    return bool(_target_date_pattern(date_obj).search(text or ""))
+
+
+@functools.lru_cache(maxsize=32)
+def _dt_dd_pattern_by_id(dt_id: str) -> re.Pattern:
+    return re.compile(rf"<dt[^>]*id=[\"']{re.escape(dt_id)}[\"'][^>]*>.*?</dt>\s*<dd[^>]*>(.*?)</dd>", re.S | re.I)
+
+
+@functools.lru_cache(maxsize=32)
+def _dt_dd_pattern_by_label(label: str) -> re.Pattern:
+    return re.compile(rf"<dt[^>]*>\s*{re.escape(label)}\s*</dt>\s*<dd[^>]*>(.*?)</dd>", re.S | re.I)
 
 
 def parse_dt_dd_by_id(page_html: str, dt_id: str) -> str:
-    m = re.search(rf"<dt[^>]*id=[\"']{re.escape(dt_id)}[\"'][^>]*>.*?</dt>\s*<dd[^>]*>(.*?)</dd>", page_html, re.S | re.I)
+    m = _dt_dd_pattern_by_id(dt_id).search(page_html)
     return m.group(1) if m else ""
 
 
 def parse_dt_dd_by_label(page_html: str, label: str) -> str:
-    m = re.search(rf"<dt[^>]*>\s*{re.escape(label)}\s*</dt>\s*<dd[^>]*>(.*?)</dd>", page_html, re.S | re.I)
+    m = _dt_dd_pattern_by_label(label).search(page_html)
     return m.group(1) if m else ""
 
 
@@ -208,28 +631,44 @@ def ensure_abs(base: str, maybe_rel: str) -> str:
     return urljoin(base, maybe_rel)
 
 
-def parse_kitara_detail(detail_url: str, fallback_title: str = "") -> EventItem:
-    page = fetch_text(detail_url)
-    title = strip_tags(re.search(r"<h2>(.*?)</h2>", page, re.S | re.I).group(1)) if re.search(r"<h2>(.*?)</h2>", page, re.S | re.I) else fallback_title
+def search_group(pattern: re.Pattern, text: str, default: str = "", group: int = 1) -> str:
+    m = pattern.search(text)
+    return m.group(group) if m else default
+
+
+def search_fields(pattern: re.Pattern, text: str) -> Dict[str, str]:
+    # First value of every named group, collected in a single pass.
+    fields: Dict[str, str] = {}
+    for m in pattern.finditer(text):
+        for name, value in m.groupdict().items():
+            if value is not None and name not in fields:
+                fields[name] = value
+    return fields
+
+
+def parse_kitara_detail(page: str, detail_url: str, fallback_title: str = "") -> EventItem:
+    h2_m = _RE_KITARA_H2.search(page)
+    title = strip_tags(h2_m.group(1)) if h2_m else fallback_title
 
     d_time = parse_dt_dd_by_id(page, "d_time")
     d_flyer = parse_dt_dd_by_id(page, "d_flyer")
 
-    venue_match = re.search(r"<b[^>]*class=[\"'][^\"']*place[^\"']*[\"'][^>]*>(.*?)</b>", d_time, re.S | re.I)
+    venue_match = _RE_KITARA_PLACE.search(d_time)
     venue = strip_tags(venue_match.group(1)) if venue_match else "記載なし"
 
-    time_p_match = re.search(r"<p[^>]*>(.*?)</p>", d_time, re.S | re.I)
-    time_text = strip_tags(time_p_match.group(1)) if time_p_match else strip_tags(d_time)
+    d_time_text = strip_tags(d_time)
+    time_p_match = _RE_P.search(d_time)
+    time_text = strip_tags(time_p_match.group(1)) if time_p_match else d_time_text
     date_text = first_line(time_text) or "記載なし"
-    tt = extract_times(d_time)
+    tt = extract_times_plain(d_time_text)
 
     flyer_img = ""
-    flyer_img_m = re.search(r"<img[^>]+src=[\"']([^\"']+)[\"']", d_flyer, re.S | re.I)
+    flyer_img_m = _RE_IMG_SRC.search(d_flyer)
     if flyer_img_m:
         flyer_img = ensure_abs(detail_url, flyer_img_m.group(1))
 
     flyer_links: List[LinkItem] = []
-    for lm in re.finditer(r"<a[^>]+href=[\"']([^\"']+)[\"'][^>]*>(.*?)</a>", d_flyer, re.S | re.I):
+    for lm in _RE_A_HREF.finditer(d_flyer):
         flyer_links.append(build_link(lm.group(2), ensure_abs(detail_url, lm.group(1))))
 
     return EventItem(
@@ -252,6 +691,7 @@ def parse_kitara_detail(detail_url: str, fallback_title: str = "") -> EventItem:
 
 def scrape_kitara(date_obj: dt.date, label: str) -> SiteResult:
     result = SiteResult(key="kitara", label=label, date_obj=date_obj)
+    date_iso = date_obj.isoformat()
     month = date_obj.strftime("%Y-%m")
     url = f"https://www.kitara-sapporo.or.jp/event/index.html?dsp=list&month={month}"
     page = fetch_text(url)
@@ -261,31 +701,28 @@ def scrape_kitara(date_obj: dt.date, label: str) -> SiteResult:
         return result
 
     target_prefix = f"{date_obj.year}年{date_obj.month}月{date_obj.day}日"
-    cards = re.findall(r"<article class=\"card\">(.*?)</article>", page, re.S | re.I)
-    for card in cards:
-        date_m = re.search(r"<span class=\"date\">(.*?)</span>", card, re.S | re.I)
-        if not date_m:
+    cards: List[Tuple[str, Dict[str, str]]] = []
+    for card_m in _RE_KITARA_CARD.finditer(page):
+        card = card_m.group(1)
+        fields = search_fields(_RE_KITARA_CARD_FIELDS, card)
+        if "date" not in fields:
             continue
-        card_date = strip_tags(date_m.group(1))
+        card_date = strip_tags(fields["date"])
         if not card_date.startswith(target_prefix):
             continue
 
-        title_m = re.search(r"<h4 class=\"title\">(.*?)</h4>", card, re.S | re.I)
-        href_m = re.search(r"href=\"([^\"]*event_detail\.php\?num=\d+)\"", card, re.I)
-        thumb_m = re.search(r"<div class=\"thumb\">.*?<img[^>]+src=\"([^\"]+)\"", card, re.S | re.I)
-
-        if not (title_m and href_m):
+        if "title" not in fields or "href" not in fields:
             continue
+        cards.append((ensure_abs(url, fields["href"]), fields))
 
-        detail_url = ensure_abs(url, href_m.group(1))
-        event = parse_kitara_detail(detail_url, fallback_title=strip_tags(title_m.group(1)))
-        event.date_iso = date_obj.isoformat()
+    events = fetch_and_parse(parse_kitara_detail, [(detail_url, strip_tags(fields["title"])) for detail_url, fields in cards])
+    for (detail_url, fields), event in zip(cards, events):
+        event.date_iso = date_iso
         # Fallbacks from card if detail page lacks data
-        if event.venue == "記載なし":
-            place_m = re.search(r"<b class=\"place[^\"]*\">(.*?)</b>", card, re.S | re.I)
-            event.venue = strip_tags(place_m.group(1)) if place_m else event.venue
-        if not event.flyer_image and thumb_m:
-            event.flyer_image = ensure_abs(url, thumb_m.group(1))
+        if event.venue == "記載なし" and "place" in fields:
+            event.venue = strip_tags(fields["place"])
+        if not event.flyer_image and "thumb" in fields:
+            event.flyer_image = ensure_abs(url, fields["thumb"])
             event.flyer_alt = f"{event.title} 画像"
             event.flyer_missing = ""
         result.events.append(event)
@@ -295,9 +732,8 @@ def scrape_kitara(date_obj: dt.date, label: str) -> SiteResult:
     return result
 
 
-def parse_community_plaza_detail(detail_url: str, target_date: dt.date, label: str) -> EventItem:
-    page = fetch_text(detail_url)
-    title_m = re.search(r"<h3 class=\"title\">(.*?)</h3>", page, re.S | re.I)
+def parse_community_plaza_detail(page: str, detail_url: str, target_date: dt.date, label: str) -> EventItem:
+    title_m = _RE_PLAZA_TITLE.search(page)
     title = strip_tags(title_m.group(1)) if title_m else "公演名不明"
 
     datetime_dd = parse_dt_dd_by_label(page, "日時")
@@ -306,13 +742,13 @@ def parse_community_plaza_detail(detail_url: str, target_date: dt.date, label: s
 
     dt_text = strip_tags(datetime_dd)
     date_text = first_line(dt_text) or jp_date_display(target_date)
-    tt = extract_times(datetime_dd)
+    tt = extract_times_plain(dt_text)
     venue = first_line(strip_tags(venue_dd)) or "記載なし"
 
     flyer_image = ""
     flyer_alt = ""
     image_candidates = []
-    for m in re.finditer(r"<img[^>]+src=\"([^\"]+)\"[^>]*class=\"[^\"]*w top[^\"]*\"[^>]*>\s*<p>(.*?)</p>", page, re.S | re.I):
+    for m in _RE_PLAZA_IMAGE.finditer(page):
         image_candidates.append((ensure_abs(detail_url, m.group(1)), strip_tags(m.group(2))))
     if image_candidates:
         preferred = next((c for c in image_candidates if "チラシ表" in c[1]), image_candidates[0])
@@ -320,7 +756,7 @@ def parse_community_plaza_detail(detail_url: str, target_date: dt.date, label: s
         flyer_alt = caption or f"{title} フライヤー"
 
     links: List[LinkItem] = []
-    for m in re.finditer(r"<a[^>]+href=\"([^\"]+)\"[^>]*>(.*?)</a>", flyer_dl_dd, re.S | re.I):
+    for m in _RE_A_HREF_DQ.finditer(flyer_dl_dd):
         links.append(build_link(m.group(2), ensure_abs(detail_url, m.group(1))))
 
     return EventItem(
@@ -348,7 +784,8 @@ def scrape_sapporo_community_plaza(date_obj: dt.date, label: str, kind: int = 2)
 
     target_str = jp_date_compact(date_obj)
     seen = set()
-    for m in re.finditer(r"<p class=\"date\">(.*?)</p>.*?<h4 class=\"txt_b\"><a href=\"([^\"]+)\">(.*?)</a>", page, re.S | re.I):
+    detail_urls: List[str] = []
+    for m in _RE_PLAZA_ITEM.finditer(page):
         date_text = strip_tags(m.group(1))
         if target_str not in date_text:
             continue
@@ -356,10 +793,12 @@ def scrape_sapporo_community_plaza(date_obj: dt.date, label: str, kind: int = 2)
         if detail_url in seen:
             continue
         seen.add(detail_url)
-        try:
-            event = parse_community_plaza_detail(detail_url, date_obj, label)
-        except Exception as e:
-            result.note = f"一部取得失敗: {e}"
+        detail_urls.append(detail_url)
+
+    jobs = [(u, date_obj, label) for u in detail_urls]
+    for event in fetch_and_parse(parse_community_plaza_detail, jobs, return_exceptions=True):
+        if isinstance(event, Exception):
+            result.note = f"一部取得失敗: {event}"
             continue
         result.events.append(event)
 
@@ -370,33 +809,40 @@ def scrape_sapporo_community_plaza(date_obj: dt.date, label: str, kind: int = 2)
 
 def scrape_sapporo_shiminhall(date_obj: dt.date, label: str) -> SiteResult:
     result = SiteResult(key="sapporo_shiminhall", label=label, date_obj=date_obj)
+    date_iso = date_obj.isoformat()
+    date_disp = jp_date_display(date_obj)
     ymd = date_obj.strftime("%Y/%m/%d")
     url = f"https://www.sapporo-shiminhall.org/event/?ymd={ymd}"
     page = fetch_text(url)
+    if not _RE_SHIMIN_ROW_START.search(page):
+        result.note = "該当イベントなし"
+        return result
 
-    row_pat = re.compile(r"<tr id=\"(event[^\"]+)\">(.*?)</tr>", re.S | re.I)
-    for row_id, row in row_pat.findall(page):
-        day_m = re.search(r"<p class=\"day\">(\d+)</p>", row)
+    for row_m in _RE_SHIMIN_ROW.finditer(page):
+        row_id, row = row_m.groups()
+        day_m = _RE_SHIMIN_DAY.search(row)
         if not day_m or int(day_m.group(1)) != date_obj.day:
             continue
 
-        title_m = re.search(r"<td class=\"tbody01\">(.*?)</td>", row, re.S | re.I)
+        title_m = _RE_SHIMIN_TITLE.search(row)
         if not title_m:
             continue
         title = strip_tags(title_m.group(1))
 
-        open_m = re.search(r"data-label=\"開場\"[^>]*>\s*(.*?)</td>", row, re.S | re.I)
-        start_m = re.search(r"data-label=\"開演\"[^>]*>\s*(.*?)</td>", row, re.S | re.I)
-        open_t = extract_time(strip_tags(open_m.group(1)) if open_m else "", "")
-        start_t = extract_time(strip_tags(start_m.group(1)) if start_m else "", "")
+        open_m = _RE_SHIMIN_OPEN.search(row)
+        start_m = _RE_SHIMIN_START.search(row)
+        open_text = strip_tags(open_m.group(1)) if open_m else ""
+        start_text = strip_tags(start_m.group(1)) if start_m else ""
+        open_t = extract_time(open_text, "")
+        start_t = extract_time(start_text, "")
         if not open_t and open_m:
-            m2 = re.search(r"(\d{1,2}:\d{2})", strip_tags(open_m.group(1)))
+            m2 = _RE_HHMM.search(open_text)
             open_t = m2.group(1) if m2 else None
         if not start_t and start_m:
-            m2 = re.search(r"(\d{1,2}:\d{2})", strip_tags(start_m.group(1)))
+            m2 = _RE_HHMM.search(start_text)
             start_t = m2.group(1) if m2 else None
 
-        flyer_link_m = re.search(r"<p class=\"flyer\"><a href=\"([^\"]+)\"[^>]*>(.*?)</a>", row, re.S | re.I)
+        flyer_link_m = _RE_SHIMIN_FLYER.search(row)
         links: List[LinkItem] = []
         if flyer_link_m:
             links.append(build_link(flyer_link_m.group(2), ensure_abs(url, flyer_link_m.group(1))))
@@ -404,8 +850,8 @@ def scrape_sapporo_shiminhall(date_obj: dt.date, label: str) -> SiteResult:
         event = EventItem(
             site=label,
             title=title,
-            date_iso=date_obj.isoformat(),
-            date_text=jp_date_display(date_obj),
+            date_iso=date_iso,
+            date_text=date_disp,
             venue="カナモトホール（札幌市民ホール）",
             open_time=open_t or "記載なし",
             start_time=start_t or "記載なし",
@@ -424,21 +870,21 @@ def scrape_sapporo_shiminhall(date_obj: dt.date, label: str) -> SiteResult:
     return result
 
 
-def parse_musicfun_detail(detail_url: str, target_date: dt.date) -> Dict[str, str]:
-    page = fetch_text(detail_url)
+@functools.lru_cache(maxsize=8)
+def _musicfun_row_pattern(date_obj: dt.date) -> re.Pattern:
+    y, m, d = date_obj.year, date_obj.month, date_obj.day
+    return re.compile(rf"{y}年\s*{m}月\s*{d}日[^<]*<br\s*/?>\s*([^<]*?)(?=<br\s*/?>|$)", re.I)
+
+
+def parse_musicfun_detail(page: str, detail_url: str, target_date: dt.date) -> Dict[str, str]:
     out: Dict[str, str] = {"flyer_image": "", "open_time": "", "start_time": "", "end_time": ""}
 
-    img_m = re.search(r'<div[^>]*class="main"[^>]*>.*?<img[^>]+src="([^"]+)"', page, re.S | re.I)
+    img_m = _RE_MUSICFUN_MAIN_IMG.search(page)
     if img_m:
         out["flyer_image"] = ensure_abs(detail_url, img_m.group(1))
 
     # Detail pages often list multiple dates in one page; pick the row containing the target date.
-    y, m, d = target_date.year, target_date.month, target_date.day
-    row_m = re.search(
-        rf"{y}年\s*{m}月\s*{d}日[^<]*<br\s*/?>\s*([^<]*?)(?=<br\s*/?>|$)",
-        page,
-        re.I,
-    )
+    row_m = _musicfun_row_pattern(target_date).search(page)
     if row_m:
         line = strip_tags(row_m.group(1))
         out["open_time"] = normalize_hhmm(extract_time(line, "開場")) or ""
@@ -446,55 +892,50 @@ def parse_musicfun_detail(detail_url: str, target_date: dt.date) -> Dict[str, st
 
     if not out["start_time"]:
         plain = strip_tags(page)
-        lines = [ln for ln in plain.split("\n") if ln]
-        for idx, line in enumerate(lines):
-            if match_target_date_text(line, target_date):
-                window = " ".join(lines[idx : idx + 6])
-                out["open_time"] = out["open_time"] or (normalize_hhmm(extract_time(window, "開場")) or "")
-                out["start_time"] = out["start_time"] or (normalize_hhmm(extract_time(window, "開演")) or "")
-                break
+        # One scan over the whole text for the first line holding the date; only the
+        # six lines from there on are split out.
+        date_m = _target_date_line_pattern(target_date).search(plain)
+        if date_m:
+            line_start = plain.rfind("\n", 0, date_m.start()) + 1
+            window = " ".join(plain[line_start:].split("\n", 6)[:6])
+            out["open_time"] = out["open_time"] or (normalize_hhmm(extract_time(window, "開場")) or "")
+            out["start_time"] = out["start_time"] or (normalize_hhmm(extract_time(window, "開演")) or "")
     return out
 
 
 def scrape_musicfun(date_obj: dt.date, label: str) -> SiteResult:
     result = SiteResult(key="musicfun", label=label, date_obj=date_obj)
+    date_iso = date_obj.isoformat()
+    date_disp = jp_date_display(date_obj)
     url = "https://musicfun.co.jp/schedule"
     page = fetch_text(url)
 
-    item_pat = re.compile(
-        r"<li>\s*<a href=\"([^\"]+)\">\s*"
-        r"<img[^>]+src=\"([^\"]+)\"[^>]*>\s*<div>\s*"
-        r"<h5>(.*?)</h5>\s*"
-        r"<p class=\"date\">(.*?)</p>\s*"
-        r"<p class=\"lead\">(.*?)</p>",
-        re.S | re.I,
-    )
-    detail_cache: Dict[str, Dict[str, str]] = {}
-    for href, img, title_html, date_html, lead_html in item_pat.findall(page):
-        card_date = parse_jp_date_from_text(strip_tags(date_html))
-        if card_date != date_obj:
+    items: List[Tuple[str, ...]] = []
+    for item_m in _RE_MUSICFUN_ITEM.finditer(page):
+        href, img, title_html, date_html, lead_html = item_m.groups()
+        date_text = strip_tags(date_html)
+        if parse_jp_date_from_text(date_text) != date_obj:
             continue
-        detail_url = ensure_abs(url, href)
-        if detail_url not in detail_cache:
-            try:
-                detail_cache[detail_url] = parse_musicfun_detail(detail_url, date_obj)
-            except Exception:
-                detail_cache[detail_url] = {"flyer_image": "", "open_time": "", "start_time": "", "end_time": ""}
-        d = detail_cache[detail_url]
+        items.append((ensure_abs(url, href), img, strip_tags(title_html), date_text, lead_html))
+
+    details = fetch_and_parse(parse_musicfun_detail, [(item[0], date_obj) for item in items], return_exceptions=True)
+    for (detail_url, img, title, date_text, lead_html), d in zip(items, details):
+        if isinstance(d, Exception):
+            d = {"flyer_image": "", "open_time": "", "start_time": "", "end_time": ""}
         flyer = d.get("flyer_image") or ensure_abs(url, img)
         result.events.append(
             EventItem(
                 site=label,
-                title=strip_tags(title_html) or "公演名不明",
-                date_iso=date_obj.isoformat(),
-                date_text=strip_tags(date_html) or jp_date_display(date_obj),
+                title=title or "公演名不明",
+                date_iso=date_iso,
+                date_text=date_text or date_disp,
                 venue=first_line(strip_tags(lead_html)) or "記載なし",
                 open_time=d.get("open_time") or "記載なし",
                 start_time=d.get("start_time") or "記載なし",
                 end_time=d.get("end_time") or "記載なし",
                 url=detail_url,
                 flyer_image=flyer,
-                flyer_alt=f"{strip_tags(title_html)} フライヤー",
+                flyer_alt=f"{title} フライヤー",
                 flyer_missing="フライヤーなし（掲載なし）" if not flyer else "",
             )
         )
@@ -503,44 +944,39 @@ def scrape_musicfun(date_obj: dt.date, label: str) -> SiteResult:
     return result
 
 
-def parse_mountalive_detail(detail_url: str) -> Dict[str, str]:
-    page = fetch_text(detail_url)
+def parse_mountalive_detail(page: str, detail_url: str) -> Dict[str, str]:
     out = {"open_time": "", "start_time": "", "date_text": "", "venue": "", "flyer_image": ""}
 
-    date_m = re.search(r"<p id=\"op_st_date\">\s*(.*?)\s*</p>", page, re.S | re.I)
+    date_m = _RE_MA_DATE.search(page)
     if date_m:
         out["date_text"] = strip_tags(date_m.group(1))
 
-    time_m = re.search(r"id='op_st_time'[^>]*>\s*OPEN\s*/\s*(\d{1,2}:\d{2}).*?START\s*/\s*(\d{1,2}:\d{2})", page, re.S | re.I)
+    time_m = _RE_MA_TIME.search(page)
     if time_m:
         out["open_time"] = normalize_hhmm(time_m.group(1)) or ""
         out["start_time"] = normalize_hhmm(time_m.group(2)) or ""
 
-    hall_m = re.search(r"<p id='hall_name'[^>]*>(.*?)</p>", page, re.S | re.I)
+    hall_m = _RE_MA_HALL.search(page)
     if hall_m:
         out["venue"] = strip_tags(hall_m.group(1))
 
-    img_m = re.search(r"<div class=\"swiper-slide\"><img src=\"([^\"]+)\"", page, re.I)
+    img_m = _RE_MA_IMG.search(page)
     if img_m:
         out["flyer_image"] = ensure_abs(detail_url, img_m.group(1))
     return out
 
 
 def _mountalive_event_from_detail(
+    dd: Any,
     date_obj: dt.date,
     label: str,
     detail_url: str,
     title_raw: str,
     venue_hint: str,
     flyer_hint: str,
-    detail_cache: Dict[str, Dict[str, str]],
 ) -> EventItem:
-    if detail_url not in detail_cache:
-        try:
-            detail_cache[detail_url] = parse_mountalive_detail(detail_url)
-        except Exception:
-            detail_cache[detail_url] = {"open_time": "", "start_time": "", "date_text": "", "venue": "", "flyer_image": ""}
-    dd = detail_cache[detail_url]
+    if isinstance(dd, Exception):
+        dd = {"open_time": "", "start_time": "", "date_text": "", "venue": "", "flyer_image": ""}
     title = collapse_ws(title_raw) or "公演名不明"
     venue = dd.get("venue") or collapse_ws(venue_hint) or "記載なし"
     flyer = dd.get("flyer_image") or flyer_hint or ""
@@ -560,16 +996,22 @@ def _mountalive_event_from_detail(
     )
 
 
-def scrape_mountalive_html(date_obj: dt.date, label: str, detail_cache: Dict[str, Dict[str, str]]) -> List[EventItem]:
+def _mountalive_events(pending: List[Dict[str, Any]]) -> List[EventItem]:
+    details = fetch_and_parse(parse_mountalive_detail, [(kwargs["detail_url"],) for kwargs in pending], return_exceptions=True)
+    return [_mountalive_event_from_detail(dd, **kwargs) for dd, kwargs in zip(details, pending)]
+
+
+def scrape_mountalive_html(date_obj: dt.date, label: str) -> List[EventItem]:
     page_url = "https://www.mountalive.com/schedule/"
     page = fetch_text(page_url)
-    items: List[EventItem] = []
+    pending: List[Dict[str, Any]] = []
     seen_urls: set[str] = set()
 
-    for block in re.findall(r"<div class=['\"]title['\"]>(.*?)</div>", page, re.S | re.I):
+    for block_m in _RE_MA_TITLE_BLOCK.finditer(page):
+        block = block_m.group(1)
         if "vevent" not in block or "value-title" not in block:
             continue
-        dt_m = re.search(r"class=['\"]value-title['\"][^>]*title=['\"](\d{4}-\d{2}-\d{2})T(\d{2}:\d{2})", block, re.I)
+        dt_m = _RE_MA_DTSTART.search(block)
         if not dt_m:
             continue
         try:
@@ -579,10 +1021,10 @@ def scrape_mountalive_html(date_obj: dt.date, label: str, detail_cache: Dict[str
         if item_date != date_obj:
             continue
 
-        href_m = re.search(r"<a[^>]+href=['\"]([^'\"]*more\.php\?no=\d+)[^'\"]*['\"]", block, re.I)
-        summary_m = re.search(r"<span class=['\"]summary['\"]>(.*?)</span>", block, re.S | re.I)
-        title_attr_m = re.search(r"<a[^>]+title=['\"](.*?)['\"]", block, re.S | re.I)
-        hall_m = re.search(r"class=['\"][^'\"]*\bhall\b[^'\"]*['\"][^>]*title=['\"](.*?)['\"]", block, re.S | re.I)
+        href_m = _RE_MA_HREF.search(block)
+        summary_m = _RE_MA_SUMMARY.search(block)
+        title_attr_m = _RE_MA_TITLE_ATTR.search(block)
+        hall_m = _RE_MA_HALL_ATTR.search(block)
 
         if not href_m:
             continue
@@ -594,28 +1036,54 @@ def scrape_mountalive_html(date_obj: dt.date, label: str, detail_cache: Dict[str
         title_raw = strip_tags(summary_m.group(1)) if summary_m else strip_tags(title_attr_m.group(1) if title_attr_m else "")
         venue_hint = strip_tags(hall_m.group(1)) if hall_m else ""
 
-        items.append(
-            _mountalive_event_from_detail(
+        pending.append(
+            dict(
                 date_obj=date_obj,
                 label=label,
                 detail_url=detail_url,
                 title_raw=title_raw,
                 venue_hint=venue_hint,
                 flyer_hint="",
-                detail_cache=detail_cache,
             )
         )
-    return items
+    return _mountalive_events(pending)
+
+
+def _xml_local_name(tag: str) -> str:
+    return tag.rsplit("}", 1)[-1]
+
+
+def iter_rss_items(xml_text: str) -> Iterator[Tuple[str, str, str]]:
+    # Yields (title, link, description_html) per <item>.
+    try:
+        root = ET.fromstring(xml_text)
+    except ET.ParseError:
+        # Malformed feed: fall back to scanning the raw text.
+        for item_m in _RE_MA_RSS_ITEM.finditer(xml_text):
+            item = item_m.group(1)
+            title_m = _RE_MA_RSS_TITLE.search(item)
+            link_m = _RE_MA_RSS_LINK.search(item)
+            desc_m = _RE_MA_RSS_DESC.search(item)
+            if link_m and desc_m:
+                yield (title_m.group(1) if title_m else ""), link_m.group(1), html.unescape(desc_m.group(1))
+        return
+    for item in root.iter():
+        if _xml_local_name(item.tag) != "item":
+            continue
+        fields: Dict[str, str] = {}
+        for child in item:
+            fields.setdefault(_xml_local_name(child.tag), child.text or "")
+        if "link" in fields and "description" in fields:
+            yield fields.get("title", ""), fields["link"], fields["description"]
 
 
 def scrape_mountalive(date_obj: dt.date, label: str) -> SiteResult:
     result = SiteResult(key="mountalive", label=label, date_obj=date_obj)
-    detail_cache: Dict[str, Dict[str, str]] = {}
     seen_urls: set[str] = set()
 
     # Primary source: desktop schedule page (contains current listings that can lag in schedule.xml).
     try:
-        for ev in scrape_mountalive_html(date_obj, label, detail_cache):
+        for ev in scrape_mountalive_html(date_obj, label):
             result.events.append(ev)
             seen_urls.add(ev.url)
     except Exception:
@@ -625,21 +1093,16 @@ def scrape_mountalive(date_obj: dt.date, label: str) -> SiteResult:
     xml_bytes = fetch_bytes("http://www.mountalive.com/schedule/schedule.xml")
     xml_text = decode_bytes(xml_bytes, ["euc_jp", "cp932", "utf-8"])
 
-    for item_m in re.finditer(r"<item>(.*?)</item>", xml_text, re.S | re.I):
-        item = item_m.group(1)
-        title_raw = strip_tags(re.search(r"<title>(.*?)</title>", item, re.S | re.I).group(1)) if re.search(r"<title>(.*?)</title>", item, re.S | re.I) else ""
-        link_m = re.search(r"<link>(.*?)</link>", item, re.S | re.I)
-        desc_m = re.search(r"<description>(.*?)</description>", item, re.S | re.I)
-        if not (link_m and desc_m):
-            continue
-        desc_html = html.unescape(desc_m.group(1))
-        d_m = re.search(r"公演日：(\d{4})年(\d{1,2})月(\d{1,2})日", desc_html)
+    pending: List[Dict[str, Any]] = []
+    for item_title, item_link, desc_html in iter_rss_items(xml_text):
+        title_raw = strip_tags(item_title)
+        d_m = _RE_MA_RSS_DATE.search(desc_html)
         if not d_m:
             continue
         item_date = dt.date(int(d_m.group(1)), int(d_m.group(2)), int(d_m.group(3)))
         if item_date != date_obj:
             continue
-        detail_url = ensure_abs("http://www.mountalive.com/schedule/", link_m.group(1).strip())
+        detail_url = ensure_abs("http://www.mountalive.com/schedule/", item_link.strip())
         if detail_url in seen_urls:
             continue
         desc_text = strip_tags(desc_html)
@@ -649,22 +1112,22 @@ def scrape_mountalive(date_obj: dt.date, label: str) -> SiteResult:
             if not ln.startswith("公演日：") and not ln.startswith("会場：") and not ln.startswith("出演："):
                 desc_title = ln
                 break
-        venue_m = re.search(r"会場：(.+)", desc_text)
+        venue_m = _RE_MA_RSS_VENUE.search(desc_text)
         venue = venue_m.group(1).strip() if venue_m else ""
-        flyer_m = re.search(r"<img src='([^']+)'", desc_html, re.I)
+        flyer_m = _RE_MA_RSS_IMG.search(desc_html)
         flyer = ensure_abs(detail_url, flyer_m.group(1)) if flyer_m else ""
-        result.events.append(
-            _mountalive_event_from_detail(
+        pending.append(
+            dict(
                 date_obj=date_obj,
                 label=label,
                 detail_url=detail_url,
                 title_raw=(desc_title or title_raw or "公演名不明"),
                 venue_hint=venue,
                 flyer_hint=flyer,
-                detail_cache=detail_cache,
             )
         )
         seen_urls.add(detail_url)
+    result.events.extend(_mountalive_events(pending))
 
     if not result.events:
         result.note = "該当イベントなし"
@@ -673,9 +1136,10 @@ def scrape_mountalive(date_obj: dt.date, label: str) -> SiteResult:
 
 def scrape_wess(date_obj: dt.date, label: str) -> SiteResult:
     result = SiteResult(key="wess", label=label, date_obj=date_obj)
+    date_iso = date_obj.isoformat()
+    date_disp = jp_date_display(date_obj)
     url = "https://wess.jp/wp-json/posts?filter[posts_per_page]=500"
-    raw = fetch_text(url)
-    posts = json.loads(raw)
+    posts = json_loads(fetch_bytes(url))
     target = date_obj.strftime("%Y%m%d")
     for post in posts:
         meta = post.get("meta") or {}
@@ -691,8 +1155,8 @@ def scrape_wess(date_obj: dt.date, label: str) -> SiteResult:
             EventItem(
                 site=label,
                 title=title,
-                date_iso=date_obj.isoformat(),
-                date_text=jp_date_display(date_obj),
+                date_iso=date_iso,
+                date_text=date_disp,
                 venue=collapse_ws(str(meta.get("kaijo", "") or "")) or "記載なし",
                 open_time=normalize_hhmm(str(meta.get("kaijojikan", "") or "")) or "記載なし",
                 start_time=normalize_hhmm(str(meta.get("kaienjikan", "") or "")) or "記載なし",
@@ -710,31 +1174,30 @@ def scrape_wess(date_obj: dt.date, label: str) -> SiteResult:
 
 def scrape_kyobun(date_obj: dt.date, label: str) -> SiteResult:
     result = SiteResult(key="kyobun", label=label, date_obj=date_obj)
+    date_iso = date_obj.isoformat()
+    date_disp = jp_date_display(date_obj)
     ym = date_obj.strftime("%Y%m")
     url = f"https://www.kyobun.org/event_schedule.html?k=lst&ym={ym}&h=a"
     page = fetch_text(url)
 
-    for dt_html, dd_html in re.findall(r"<dt class=\"date\">(.*?)</dt>\s*<dd class=\"event_link\">(.*?)</dd>", page, re.S | re.I):
+    for item_m in _RE_KYOBUN_ITEM.finditer(page):
+        dt_html, dd_html = item_m.groups()
         dt_text = strip_tags(dt_html)
         if not match_target_date_text(dt_text, date_obj):
             continue
-        title_link_m = re.search(r"<p class=\"title\">.*?<a href=\"([^\"]+)\">(.*?)</a>", dd_html, re.S | re.I)
-        title_plain_m = re.search(r"<p class=\"title\">(.*?)</p>", dd_html, re.S | re.I)
-        time_m = re.search(r"<p class=\"time\">(.*?)</p>", dd_html, re.S | re.I)
-        img_m = re.search(r"<div class=\"event_photo\">.*?<img[^>]+src=\"([^\"]+)\"", dd_html, re.S | re.I)
-        hall_m = re.search(r"<p class=\"icon ([^\"]+)\">(.*?)</p>", dd_html, re.S | re.I)
-
-        tt = extract_times(time_m.group(1) if time_m else "")
-        title = strip_tags(title_link_m.group(2)) if title_link_m else strip_tags(title_plain_m.group(1) if title_plain_m else "")
-        event_url = ensure_abs(url, title_link_m.group(1)) if title_link_m else url
-        venue = strip_tags(hall_m.group(2)) if hall_m else "記載なし"
-        flyer = ensure_abs(url, img_m.group(1)) if img_m else ""
+        fields = search_fields(_RE_KYOBUN_FIELDS, dd_html)
+
+        tt = extract_times(fields.get("time", ""))
+        title = strip_tags(fields["link_title"] if "href" in fields else fields.get("title", ""))
+        event_url = ensure_abs(url, fields["href"]) if "href" in fields else url
+        venue = strip_tags(fields["hall"]) if "hall" in fields else "記載なし"
+        flyer = ensure_abs(url, fields["img"]) if "img" in fields else ""
         result.events.append(
             EventItem(
                 site=label,
                 title=title or "公演名不明",
-                date_iso=date_obj.isoformat(),
-                date_text=jp_date_display(date_obj),
+                date_iso=date_iso,
+                date_text=date_disp,
                 venue=venue,
                 open_time=tt["open"] or "記載なし",
                 start_time=tt["start"] or "記載なし",
@@ -765,26 +1228,27 @@ def scrape_kyobun(date_obj: dt.date, label: str) -> SiteResult:
 
 def scrape_sapporo_dome(date_obj: dt.date, label: str) -> SiteResult:
     result = SiteResult(key="sapporo_dome", label=label, date_obj=date_obj)
+    date_iso = date_obj.isoformat()
+    date_disp = jp_date_display(date_obj)
     url = "https://www.sapporo-dome.co.jp/eventlist/"
     page = fetch_text(url)
     target = date_obj.strftime("%Y%m%d")
-    block_pat = re.compile(
-        r"<li class=\"un_eventlist_item[^\"]*\"[^>]*data-event-day=\"(\d{8})\"[^>]*>(.*?)</li>\s*(?=<li class=\"un_eventlist_item|</ul>)",
-        re.S | re.I,
-    )
-    for day, block in block_pat.findall(page):
+    if not re.search(f'data-event-day="{target}"', page, re.I):
+        result.note = "該当イベントなし"
+        return result
+    for block_m in _RE_DOME_BLOCK.finditer(page):
+        day, block = block_m.groups()
         if day != target:
             continue
-        title_main = strip_tags(re.search(r"un_eventlist_detailTtl__main\">(.*?)</span>", block, re.S | re.I).group(1)) if re.search(r"un_eventlist_detailTtl__main\">(.*?)</span>", block, re.S | re.I) else ""
-        title_sub = strip_tags(re.search(r"un_eventlist_detailTtl__sub\">(.*?)</span>", block, re.S | re.I).group(1)) if re.search(r"un_eventlist_detailTtl__sub\">(.*?)</span>", block, re.S | re.I) else ""
+        title_main = strip_tags(search_group(_RE_DOME_TITLE_MAIN, block))
+        title_sub = strip_tags(search_group(_RE_DOME_TITLE_SUB, block))
         title = f"{title_sub} {title_main}".strip() if title_sub else (title_main or "公演名不明")
-        url_m = re.search(r"<a[^>]*class=\"js_eventItemLink\"[^>]*href=\"([^\"]+)\"", block, re.I) or re.search(r"<a[^>]*href=\"([^\"]+)\"[^>]*class=\"js_eventItemLink\"", block, re.I)
-        img_m = re.search(r"<div class=\"un_eventlist_img.*?<img[^>]+data-src=\"([^\"]+)\"", block, re.S | re.I)
-        if not img_m:
-            img_m = re.search(r"<div class=\"un_eventlist_img.*?<img[^>]+src=\"([^\"]+)\"", block, re.S | re.I)
+        href = search_group(_RE_DOME_LINK, block)
+        img_m = _RE_DOME_IMG.search(block)
+        img_src = (img_m.group(1) or img_m.group(2)) if img_m else ""
 
         open_time = start_time = end_time = ""
-        for tm in re.finditer(r"<dt class=\"un_eventlist_opentimeTtl\">(.*?)</dt>\s*<dd class=\"un_eventlist_opentimeTxt\">(.*?)</dd>", block, re.S | re.I):
+        for tm in _RE_DOME_TIME_ROW.finditer(block):
             k = strip_tags(tm.group(1))
             v = extract_any_hhmm(strip_tags(tm.group(2))) or ""
             if "開場" in k:
@@ -798,16 +1262,16 @@ def scrape_sapporo_dome(date_obj: dt.date, label: str) -> SiteResult:
             EventItem(
                 site=label,
                 title=title,
-                date_iso=date_obj.isoformat(),
-                date_text=jp_date_display(date_obj),
+                date_iso=date_iso,
+                date_text=date_disp,
                 venue="大和ハウス プレミストドーム（札幌ドーム）",
                 open_time=open_time or "記載なし",
                 start_time=start_time or "記載なし",
                 end_time=end_time or "記載なし",
-                url=ensure_abs(url, url_m.group(1)) if url_m else url,
-                flyer_image=ensure_abs(url, img_m.group(1)) if img_m else "",
+                url=ensure_abs(url, href) if href else url,
+                flyer_image=ensure_abs(url, img_src) if img_src else "",
                 flyer_alt=f"{title} フライヤー",
-                flyer_missing="フライヤーなし（掲載なし）" if not img_m else "",
+                flyer_missing="フライヤーなし（掲載なし）" if not img_src else "",
             )
         )
     if not result.events:
@@ -817,17 +1281,20 @@ def scrape_sapporo_dome(date_obj: dt.date, label: str) -> SiteResult:
 
 def scrape_sora_scc(date_obj: dt.date, label: str) -> SiteResult:
     result = SiteResult(key="sora_scc", label=label, date_obj=date_obj)
+    date_iso = date_obj.isoformat()
+    date_disp = jp_date_display(date_obj)
     url = "https://www.sora-scc.jp/event/"
     page = fetch_text(url)
-    for block in re.findall(r"<li><time>.*?</li>", page, re.S | re.I):
-        time_m = re.search(r"<time>(.*?)</time>", block, re.S | re.I)
+    for block_m in _RE_SORA_BLOCK.finditer(page):
+        block = block_m.group(0)
+        time_m = _RE_SORA_TIME.search(block)
         if not time_m:
             continue
         date_text = strip_tags(time_m.group(1))
         if not match_target_date_text(date_text, date_obj):
             continue
-        title_m = re.search(r"<dt>催事名</dt><dd>(.*?)</dd>", block, re.S | re.I)
-        org_m = re.search(r"<dt>主催者名</dt><dd>(.*?)</dd>", block, re.S | re.I)
+        title_m = _RE_SORA_TITLE.search(block)
+        org_m = _RE_SORA_ORG.search(block)
         title = strip_tags(title_m.group(1)) if title_m else "公演名不明"
         org = strip_tags(org_m.group(1)) if org_m else ""
         links: List[LinkItem] = []
@@ -837,8 +1304,8 @@ def scrape_sora_scc(date_obj: dt.date, label: str) -> SiteResult:
             EventItem(
                 site=label,
                 title=title,
-                date_iso=date_obj.isoformat(),
-                date_text=date_text or jp_date_display(date_obj),
+                date_iso=date_iso,
+                date_text=date_text or date_disp,
                 venue="札幌コンベンションセンター",
                 open_time="記載なし",
                 start_time="記載なし",
@@ -855,52 +1322,69 @@ def scrape_sora_scc(date_obj: dt.date, label: str) -> SiteResult:
     return result
 
 
+def _safe_int(value: Any) -> Optional[int]:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
 def scrape_axes(date_obj: dt.date, label: str) -> SiteResult:
     result = SiteResult(key="axes", label=label, date_obj=date_obj)
     url = "https://www.axes.or.jp/event_calendar/index.php"
     try:
-        data = json.loads(fetch_text("https://www.axes.or.jp/event_calendar/event.json"))
+        data = json_loads(fetch_bytes("https://www.axes.or.jp/event_calendar/event.json"))
     except Exception as e:
         result.note = f"取得失敗（event.json）: {e}"
         return result
 
+    no_data_note = "月別イベントデータを自動取得できません（JS描画/提供JSON未更新の可能性）"
     y = int(data.get("year", 0) or 0)
     m = int(data.get("month", 0) or 0)
     events = data.get("event") or []
-    if y == date_obj.year and m == date_obj.month and isinstance(events, list):
-        for ev in events:
-            try:
-                if int(ev.get("day")) != date_obj.day:
-                    continue
-            except Exception:
-                continue
-            title = collapse_ws(str(ev.get("title", "") or "催事名不明"))
-            result.events.append(
-                EventItem(
-                    site=label,
-                    title=title,
-                    date_iso=date_obj.isoformat(),
-                    date_text=jp_date_display(date_obj),
-                    venue="アクセスサッポロ",
-                    open_time="記載なし",
-                    start_time="記載なし",
-                    end_time="記載なし",
-                    url=url,
-                    flyer_image="",
-                    flyer_alt="",
-                    flyer_missing="フライヤーなし（掲載なし）",
-                )
+    # The feed covers a single month; anything else has nothing for this date.
+    if not (y == date_obj.year and m == date_obj.month and isinstance(events, list)):
+        result.note = no_data_note
+        return result
+
+    day = date_obj.day
+    date_iso = date_obj.isoformat()
+    date_disp = jp_date_display(date_obj)
+    for ev in events:
+        if not isinstance(ev, dict) or _safe_int(ev.get("day")) != day:
+            continue
+        title = collapse_ws(str(ev.get("title", "") or "催事名不明"))
+        result.events.append(
+            EventItem(
+                site=label,
+                title=title,
+                date_iso=date_iso,
+                date_text=date_disp,
+                venue="アクセスサッポロ",
+                open_time="記載なし",
+                start_time="記載なし",
+                end_time="記載なし",
+                url=url,
+                flyer_image="",
+                flyer_alt="",
+                flyer_missing="フライヤーなし（掲載なし）",
             )
+        )
     if not result.events:
-        result.note = "月別イベントデータを自動取得できません（JS描画/提供JSON未更新の可能性）"
+        result.note = no_data_note
     return result
 
 
+@functools.lru_cache(maxsize=12)
+def _makomanai_pdf_pattern(month: int) -> re.Pattern:
+    return re.compile(rf"(https?://[^\"]*gyouji{month}\.pdf|/[^\"']*gyouji{month}\.pdf)", re.I)
+
+
 def scrape_makomanai_icearena(date_obj: dt.date, label: str) -> SiteResult:
     result = SiteResult(key="makomanai_icearena", label=label, date_obj=date_obj)
     url = "http://www.makomanai.com/icearena/event"
     page = fetch_text(url)
-    pdf_m = re.search(rf"(https?://[^\"]*gyouji{date_obj.month}\.pdf|/[^\"']*gyouji{date_obj.month}\.pdf)", page, re.I)
+    pdf_m = _makomanai_pdf_pattern(date_obj.month).search(page)
     pdf_url = ensure_abs(url, pdf_m.group(1)) if pdf_m else url
     result.events.append(
         EventItem(
@@ -924,70 +1408,54 @@ def scrape_makomanai_icearena(date_obj: dt.date, label: str) -> SiteResult:
 
 
 def parse_zepp_anchor_blocks(page: str) -> List[str]:
-    blocks: List[str] = []
-    pos = 0
-    start_pat = re.compile(r"<a class=\"sch-content[^\"]*\" href=\"https://www\.zepp\.co\.jp/hall/sapporo/schedule/single/\?rid=\d+\">", re.I)
-    while True:
-        m = start_pat.search(page, pos)
-        if not m:
-            break
-        start = m.start()
-        next_m = start_pat.search(page, m.end())
-        end = next_m.start() if next_m else len(page)
-        blocks.append(page[start:end])
-        pos = end
-    return blocks
+    # Each block runs from one anchor start to the next (or the end of the page).
+    starts = [m.start() for m in _RE_ZEPP_BLOCK_START.finditer(page)]
+    ends = starts[1:] + [len(page)]
+    return [page[start:end] for start, end in zip(starts, ends)]
 
 
 def scrape_zepp_sapporo(date_obj: dt.date, label: str) -> SiteResult:
     result = SiteResult(key="zepp_sapporo", label=label, date_obj=date_obj)
+    date_iso = date_obj.isoformat()
+    date_disp = jp_date_display(date_obj)
     url = f"https://www.zepp.co.jp/hall/sapporo/schedule/?_y={date_obj.year}&_m={date_obj.month}"
     page = fetch_text(url)
 
     for block in parse_zepp_anchor_blocks(page):
-        year_m = re.search(r"sch-content-date__year\">(\d{4})</p>", block)
-        md_m = re.search(r"sch-content-date__month\">(\d{1,2})\.(\d{1,2})</p>", block)
-        if not (year_m and md_m):
+        fields = search_fields(_RE_ZEPP_FIELDS, block)
+        if "year" not in fields or "month" not in fields:
             continue
         try:
-            item_date = dt.date(int(year_m.group(1)), int(md_m.group(1)), int(md_m.group(2)))
+            item_date = dt.date(int(fields["year"]), int(fields["month"]), int(fields["day"]))
         except ValueError:
             continue
         if item_date != date_obj:
             continue
 
-        href_m = re.search(r"<a class=\"sch-content[^\"]*\" href=\"([^\"]+)\"", block)
-        img_m = re.search(r"<div class=\"sch-content-img\">.*?<img src=\"([^\"]+)\"", block, re.S | re.I)
-        perf_m = re.search(r"sch-content-text__performer\">(.*?)</h2>", block, re.S | re.I)
-        ttl_m = re.search(r"sch-content-text__ttl\">(.*?)</h3>", block, re.S | re.I)
-        performer = strip_tags(perf_m.group(1)) if perf_m else ""
-        ttl = strip_tags(ttl_m.group(1)) if ttl_m else ""
+        event_url = ensure_abs(url, fields["href"]) if "href" in fields else url
+        flyer = ensure_abs(url, fields["img"]) if "img" in fields else ""
+        performer = strip_tags(fields.get("performer", ""))
+        ttl = strip_tags(fields.get("title", ""))
         base_title = ttl or performer or "公演名不明"
         if performer and ttl and performer != ttl:
             base_title = f"{performer} / {ttl}"
 
-        time_rows = list(
-            re.finditer(
-                r"sch-content-text-date\">.*?sch-content-text-date__open\">(\d{1,2}:\d{2})</span>.*?sch-content-text-date__start\">(\d{1,2}:\d{2})</span>",
-                block,
-                re.S | re.I,
-            )
-        )
+        time_rows = list(_RE_ZEPP_TIME_ROW.finditer(block))
         if not time_rows:
             result.events.append(
                 EventItem(
                     site=label,
                     title=base_title,
-                    date_iso=date_obj.isoformat(),
-                    date_text=jp_date_display(date_obj),
+                    date_iso=date_iso,
+                    date_text=date_disp,
                     venue="Zepp Sapporo",
                     open_time="記載なし",
                     start_time="記載なし",
                     end_time="記載なし",
-                    url=ensure_abs(url, href_m.group(1)) if href_m else url,
-                    flyer_image=ensure_abs(url, img_m.group(1)) if img_m else "",
+                    url=event_url,
+                    flyer_image=flyer,
                     flyer_alt=f"{base_title} フライヤー",
-                    flyer_missing="フライヤーなし（掲載なし）" if not img_m else "",
+                    flyer_missing="フライヤーなし（掲載なし）" if not flyer else "",
                 )
             )
             continue
@@ -997,16 +1465,16 @@ def scrape_zepp_sapporo(date_obj: dt.date, label: str) -> SiteResult:
                 EventItem(
                     site=label,
                     title=title,
-                    date_iso=date_obj.isoformat(),
-                    date_text=jp_date_display(date_obj),
+                    date_iso=date_iso,
+                    date_text=date_disp,
                     venue="Zepp Sapporo",
                     open_time=normalize_hhmm(tm.group(1)) or "記載なし",
                     start_time=normalize_hhmm(tm.group(2)) or "記載なし",
                     end_time="記載なし",
-                    url=ensure_abs(url, href_m.group(1)) if href_m else url,
-                    flyer_image=ensure_abs(url, img_m.group(1)) if img_m else "",
+                    url=event_url,
+                    flyer_image=flyer,
                     flyer_alt=f"{base_title} フライヤー",
-                    flyer_missing="フライヤーなし（掲載なし）" if not img_m else "",
+                    flyer_missing="フライヤーなし（掲載なし）" if not flyer else "",
                 )
             )
     if not result.events:
@@ -1014,14 +1482,18 @@ def scrape_zepp_sapporo(date_obj: dt.date, label: str) -> SiteResult:
     return result
 
 
+def event_sort_key(ev: EventItem) -> Tuple[str, str, str]:
+    start = ev.start_time if _is_hhmm(ev.start_time) else "99:99"
+    return (ev.date_iso, start, ev.title)
+
+
 def sort_events(events: List[EventItem]) -> List[EventItem]:
-    def key(ev: EventItem):
-        start = ev.start_time if re.fullmatch(r"\d{1,2}:\d{2}", ev.start_time or "") else "99:99"
-        return (ev.date_iso, start, ev.title)
-    return sorted(events, key=key)
+    return sorted(events, key=event_sort_key)
 
 
 def esc(s: str) -> str:
+    # html.escape's chained str.replace calls run in C; a str.translate table is
+    # several times slower on these short, mostly non-ASCII strings.
     return html.escape(s, quote=True)
 
 
@@ -1031,59 +1503,70 @@ def render_flyer(event: EventItem) -> str:
     return f'<div class="flyer none">{esc(event.flyer_missing or "フライヤーなし（掲載なし）")}</div>'
 
 
-def render_gcal_button(event: EventItem) -> str:
-    if not (re.fullmatch(r"\d{4}-\d{2}-\d{2}", event.date_iso or "") and re.fullmatch(r"\d{1,2}:\d{2}", event.start_time or "") and re.fullmatch(r"\d{1,2}:\d{2}", event.end_time or "")):
+def escape_event(event: EventItem) -> EscapedEvent:
+    return EscapedEvent(
+        title=esc(event.title),
+        date_iso=esc(event.date_iso),
+        venue=esc(event.venue),
+        start_time=esc(event.start_time),
+        end_time=esc(event.end_time),
+        url=esc(event.url),
+    )
+
+
+def render_gcal_button(event: EventItem, escaped: Optional[EscapedEvent] = None) -> str:
+    if not (_is_hhmm(event.start_time) and _is_hhmm(event.end_time) and _RE_ISO_DATE.fullmatch(event.date_iso or "")):
         return ""
+    e = escaped or escape_event(event)
     return (
         f'<a class="btn gcal gcal-btn" href="#" '
-        f'data-title="{esc(event.title)}" '
-        f'data-date="{esc(event.date_iso)}" '
-        f'data-start="{esc(event.start_time)}" '
-        f'data-end="{esc(event.end_time)}" '
-        f'data-location="{esc(event.venue)}" '
-        f'data-url="{esc(event.url)}">Googleカレンダーに追加</a>'
+        f'data-title="{e.title}" '
+        f'data-date="{e.date_iso}" '
+        f'data-start="{e.start_time}" '
+        f'data-end="{e.end_time}" '
+        f'data-location="{e.venue}" '
+        f'data-url="{e.url}">Googleカレンダーに追加</a>'
     )
 
 
-def render_links(event: EventItem) -> str:
+def render_links(event: EventItem, escaped: Optional[EscapedEvent] = None) -> str:
     items: List[str] = []
-    gcal = render_gcal_button(event)
+    gcal = render_gcal_button(event, escaped)
     if gcal:
         items.append(gcal)
     for link in event.links:
         items.append(f'<a class="btn" href="{esc(link.url)}" target="_blank" rel="noopener">{esc(link.label)}</a>')
     if not items:
         return ""
-    return '<div class="links">' + "".join(items) + "</div>"
+    return f'<div class="links">{"".join(items)}</div>'
 
 
 def render_event_card(event: EventItem) -> str:
-    end_display = event.end_time
+    e = escape_event(event)
+    end_display = e.end_time
     if event.end_time != "記載なし" and event.end_estimated:
-        end_display = f"{event.end_time}（予定）"
-    body = [
-        '<article class="card">',
-        render_flyer(event),
-        '<div class="body">',
-        f'<h3 class="title">{esc(event.title)}</h3>',
-        '<div class="chips">',
-        f'<span class="chip">{esc(event.site)}</span>',
-        f'<span class="chip">{esc(event.date_iso.replace("-", "/"))}</span>',
-        '</div>',
-        '<dl>',
-        f'<dt>日時</dt><dd>{esc(event.date_text)}</dd>',
-        f'<dt>会場</dt><dd>{esc(event.venue or "記載なし")}</dd>',
-        f'<dt>開場</dt><dd>{esc(event.open_time or "記載なし")}</dd>',
-        f'<dt>開演</dt><dd>{esc(event.start_time or "記載なし")}</dd>',
-        f'<dt>終演</dt><dd>{esc(end_display or "記載なし")}</dd>',
-        f'<dt>URL</dt><dd><a href="{esc(event.url)}" target="_blank" rel="noopener">詳細ページ</a></dd>',
-        '</dl>',
-    ]
-    links_html = render_links(event)
-    if links_html:
-        body.append(links_html)
-    body.extend(['</div>', '</article>'])
-    return "".join(body)
+        end_display = f"{e.end_time}（予定）"
+    return (
+        '<article class="card">'
+        f"{render_flyer(event)}"
+        '<div class="body">'
+        f'<h3 class="title">{e.title}</h3>'
+        '<div class="chips">'
+        f'<span class="chip">{esc(event.site)}</span>'
+        f'<span class="chip">{e.date_iso.replace("-", "/")}</span>'
+        '</div>'
+        '<dl>'
+        f'<dt>日時</dt><dd>{esc(event.date_text)}</dd>'
+        f'<dt>会場</dt><dd>{e.venue or "記載なし"}</dd>'
+        f'<dt>開場</dt><dd>{esc(event.open_time or "記載なし")}</dd>'
+        f'<dt>開演</dt><dd>{e.start_time or "記載なし"}</dd>'
+        f'<dt>終演</dt><dd>{end_display or "記載なし"}</dd>'
+        f'<dt>URL</dt><dd><a href="{e.url}" target="_blank" rel="noopener">詳細ページ</a></dd>'
+        '</dl>'
+        f"{render_links(event, e)}"
+        '</div>'
+        '</article>'
+    )
 
 
 def render_empty_card(label: str, note: str, date_obj: dt.date) -> str:
@@ -1110,7 +1593,7 @@ def render_site_block(site: SiteResult) -> str:
     cards_html = "".join(render_event_card(ev) for ev in sort_events(site.events)) if site.events else render_empty_card(site.label, site.note, site.date_obj)
     return (
         '<!-- SITE BLOCK START -->'
-        f'<section class="site-block">'
+        '<section class="site-block">'
         f'<h2>{esc(title)}</h2>'
         '<div class="grid">'
         f'{cards_html}'
@@ -1120,46 +1603,61 @@ def render_site_block(site: SiteResult) -> str:
     )
 
 
-def render_global_block(date_obj: dt.date, site_results: List[SiteResult]) -> str:
+def global_block_parts(date_obj: dt.date, site_results: List[SiteResult]) -> List[str]:
+    # The global block as a list of fragments (one per card), so the caller can
+    # join it together with the rest of the page in a single pass.
     events = []
     for site in site_results:
         events.extend(site.events)
     title = f"当日イベント一覧（開演順）{jp_date_display(date_obj)}"
-    cards_html = "".join(render_event_card(ev) for ev in sort_events(events)) if events else render_empty_card("全サイト横断", "該当イベントなし", date_obj)
-    return (
-        '<!-- SITE BLOCK START -->'
-        '<section class="site-block">'
+    cards = [render_event_card(ev) for ev in sort_events(events)] if events else [render_empty_card("全サイト横断", "該当イベントなし", date_obj)]
+    return [
+        '<!-- SITE BLOCK START --><section class="site-block">'
         f"<h2>{esc(title)}</h2>"
-        '<div class="grid">'
-        f"{cards_html}"
-        "</div>"
-        "</section>"
-        '<!-- SITE BLOCK END -->'
-    )
+        '<div class="grid">',
+        *cards,
+        "</div></section><!-- SITE BLOCK END -->",
+    ]
 
 
 def site_order_key(site: SiteResult) -> Tuple[str, str, str]:
     if not site.events:
         return ("99:99", "99:99", site.label)
-    sorted_site_events = sort_events(site.events)
-    first = sorted_site_events[0]
-    start = first.start_time if re.fullmatch(r"\d{1,2}:\d{2}", first.start_time or "") else "99:99"
-    return (first.date_iso or "9999-99-99", start, site.label)
+    # Only the earliest event matters here; min() avoids sorting every site's list.
+    first_date, first_start, _ = min(map(event_sort_key, site.events))
+    return (first_date or "9999-99-99", first_start, site.label)
 
 
 def render_from_template(template_path: Path, out_path: Path, date_obj: dt.date, site_results: List[SiteResult]) -> None:
     template = template_path.read_text(encoding="utf-8")
-    template = re.sub(r"作成日\s*:\s*YYYY-MM-DD", f"作成日 : {date_obj.isoformat()}", template, count=1)
     ordered_sites = sorted(site_results, key=site_order_key)
     # Event cards are shown only in the global opening-time list.
     # Placeholder "no event" cards are hidden to keep the page compact.
-    blocks = render_global_block(date_obj, ordered_sites)
-    template = re.sub(r"<!-- SITE BLOCK START -->.*?<!-- SITE BLOCK END -->", blocks, template, count=1, flags=re.S)
-    out_path.write_text(template, encoding="utf-8")
+    replacements = {
+        "created": [f"作成日 : {date_obj.isoformat()}"],
+        "site_block": global_block_parts(date_obj, ordered_sites),
+    }
+    # One pass for both placeholders; each is replaced at most once, and the
+    # rendered HTML is inserted literally. The page is assembled as a flat list
+    # of fragments and joined and encoded exactly once.
+    parts: List[str] = []
+    pos = 0
+    for m in _RE_TEMPLATE_PLACEHOLDER.finditer(template):
+        fragments = replacements.pop(m.lastgroup, None)
+        if fragments is None:
+            continue
+        parts.append(template[pos : m.start()])
+        parts.extend(fragments)
+        pos = m.end()
+    parts.append(template[pos:])
+    data = "".join(parts).encode("utf-8")
+    if out_path.exists() and out_path.read_bytes() == data:
+        return
+    write_bytes_atomic(out_path, data)
 
 
 def load_config(config_path: Path) -> List[dict]:
-    data = json.loads(config_path.read_text(encoding="utf-8"))
+    data = json_loads(config_path.read_bytes())
     return [s for s in data.get("sources", []) if s.get("enabled", True)]
 
 
@@ -1193,17 +1691,45 @@ def run_scraper(source_conf: dict, date_obj: dt.date) -> SiteResult:
     return SiteResult(key=str(stype), label=label, date_obj=date_obj, note="未対応ソース")
 
 
+def scrape_source(source_conf: dict, date_obj: dt.date) -> SiteResult:
+    label = source_conf.get("label", source_conf.get("type", "source"))
+    try:
+        log.info("scraping %s for %s ...", label, date_obj.isoformat())
+        return run_scraper(source_conf, date_obj)
+    except Exception as e:
+        log.warning("%s: scrape failed: %s", label, e)
+        return SiteResult(key=str(source_conf.get("type")), label=label, date_obj=date_obj, note=f"取得失敗: {e}")
+
+
+def scrape_all(sources: List[dict], date_obj: dt.date, max_workers: int = SITE_WORKERS) -> List[SiteResult]:
+    workers = min(max_workers, len(sources))
+    if workers <= 1:
+        return [scrape_source(src, date_obj) for src in sources]
+    # executor.map keeps results in config order regardless of completion order.
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(lambda src: scrape_source(src, date_obj), sources))
+
+
 def parse_args() -> argparse.Namespace:
     p = argparse.ArgumentParser(description="Generate event-summary.html by scraping configured sources.")
     p.add_argument("--date", help="Target date in YYYY-MM-DD (default: today JST)")
     p.add_argument("--config", default="config/auto_sources.json")
     p.add_argument("--template", default="event-summary.template.html")
     p.add_argument("--output", default="event-summary.html")
+    p.add_argument(
+        "--cache-dir",
+        help=f"Store fetched pages here and reuse them on later runs for up to {FETCH_CACHE_MAX_AGE // 60} minutes, "
+        "then refetch (default: no disk cache)",
+    )
+    p.add_argument("--verbose", action="store_true", help="Print each site's scraped result as JSON")
+    p.add_argument("--jobs", type=int, default=SITE_WORKERS, help=f"Sites scraped in parallel (default: {SITE_WORKERS}; 1 = sequential)")
     return p.parse_args()
 
 
 def main() -> int:
     args = parse_args()
+    # Worker threads log through one handler; records carry their own timestamps.
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s", stream=sys.stdout)
     root = Path(__file__).resolve().parent.parent
 
     if args.date:
@@ -1226,20 +1752,21 @@ def main() -> int:
         print(f"template not found: {template_path}", file=sys.stderr)
         return 2
 
+    if args.cache_dir:
+        set_fetch_cache_dir((root / args.cache_dir).resolve())
+
     sources = load_config(config_path)
-    results: List[SiteResult] = []
-    for src in sources:
-        label = src.get("label", src.get("type", "source"))
-        try:
-            print(f"[INFO] scraping {label} for {date_obj.isoformat()} ...")
-            results.append(run_scraper(src, date_obj))
-        except Exception as e:
-            print(f"[WARN] {label}: scrape failed: {e}")
-            results.append(SiteResult(key=str(src.get('type')), label=label, date_obj=date_obj, note=f"取得失敗: {e}"))
+    try:
+        results = scrape_all(sources, date_obj, max_workers=args.jobs)
+    finally:
+        close_connections()
 
+    if args.verbose:
+        for r in results:
+            print(dump_result(r))
     render_from_template(template_path, output_path, date_obj, results)
     total_events = sum(len(r.events) for r in results)
-    print(f"[INFO] generated {output_path} (sites={len(results)}, events={total_events})")
+    log.info("generated %s (sites=%d, events=%d)", output_path, len(results), total_events)
     return 0
 
 